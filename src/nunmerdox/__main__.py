@@ -1,14 +1,14 @@
 """Entry point para ejecutar Nunmerdox como módulo."""
 
 import sys
-from .cli import print_menu, quick_mode, interactive_mode
+from .cli import print_menu, quick_mode, interactive_mode, _EQ60
 
 def main_menu():
     """Menú principal de Nunmerdox."""
     
-    print(f"\n{'='*60}")
+    print(f"\n{_EQ60}")
     print("NUNMERDOX - OSINT Scanner de Números Telefónicos")
-    print(f"{'='*60}\n")
+    print(f"{_EQ60}\n")
     
     options = {
         1: "OSINT Completo (con opciones)",
@@ -0,0 +1,89 @@
+"""
+Caché en disco para Nunmerdox.
+Guarda los resultados de cada query OSINT en SQLite con caducidad (TTL), para que
+volver a escanear el mismo número no repita las búsquedas en DuckDuckGo.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".nunmerdox" / "osint-cache.sqlite3"
+
+# 24 horas
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class OsintCache:
+    """
+    Caché clave/valor sobre SQLite con TTL por entrada.
+
+    Cada operación abre su propia conexión, así que una misma instancia se
+    puede usar desde varios hilos. El esquema se crea una sola vez por
+    instancia y cada escritura borra las entradas caducadas, así el fichero
+    no crece sin límite. Los errores de SQLite nunca se propagan: se
+    registran y se tratan como fallo de caché.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL):
+        self.path = Path(path).expanduser()
+        self.ttl = ttl
+        self._ready = False
+
+    @staticmethod
+    def make_key(query: str, max_results: int) -> str:
+        """Clave estable para una query y su límite de resultados."""
+        return hashlib.blake2b(f"{query}|{max_results}".encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=10)
+        if not self._ready:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS osint "
+                "(key TEXT PRIMARY KEY, expires REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS osint_expires ON osint (expires)")
+            self._ready = True
+        return conn
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Retorna el valor cacheado o None si no existe o ha caducado."""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value FROM osint WHERE key = ? AND expires > ?",
+                    (key, time.time())
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Error leyendo caché OSINT ({self.path}): {e}")
+            return None
+
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: List[Dict[str, Any]]) -> None:
+        """Guarda un valor con la caducidad configurada."""
+        try:
+            conn = self._connect()
+            try:
+                now = time.time()
+                with conn:
+                    conn.execute("DELETE FROM osint WHERE expires <= ?", (now,))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO osint (key, expires, value) VALUES (?, ?, ?)",
+                        (key, now + self.ttl, json.dumps(value, ensure_ascii=False))
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Error escribiendo caché OSINT ({self.path}): {e}")
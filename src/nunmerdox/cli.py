@@ -11,13 +11,18 @@ ADVERTENCIA LEGAL:
 import logging
 import json
 import csv
-from typing import Optional, List
+import re
+import sys
+from functools import lru_cache
+from typing import Callable, Optional, List, Tuple
 from pathlib import Path
-import phonenumbers
 import typer
 from datetime import datetime
 
-from .osint import perform_osint
+try:
+    import orjson
+except ImportError:  # Dependencia opcional (pip install nunmerdox[fast])
+    orjson = None
 
 # Configurar logging
 logging.basicConfig(
@@ -26,6 +31,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx registra cada petición a nivel INFO (solo se muestra con --verbose);
+# httpcore, hpack y h2 trazan cada evento/cabecera en DEBUG: nunca se muestran
+for _name in ("httpx", "httpcore", "hpack", "h2"):
+    logging.getLogger(_name).setLevel(logging.WARNING)
+
+# Filtro previo barato: descarta basura antes de llamar a phonenumbers.parse.
+# Se aplica con fullmatch sobre la entrada ya sin espacios en los extremos:
+# ningún tramo del patrón compite por los mismos espacios (sin backtracking)
+_PHONE_RE = re.compile(r"\(?\+?[\d().\-/ ]+")
+
+# Dígitos admitidos (sin contar separadores): E.164 tiene como mucho 15, más
+# margen para prefijos de salida ("00", "0011") y el "(0)" troncal
+_PHONE_MIN_DIGITS = 7
+_PHONE_MAX_DIGITS = 20
+
+# Buffer de escritura de los ficheros de salida
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serializa a JSON UTF-8 con orjson si está instalado, si no con json."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _jsonable(res: dict) -> dict:
+    """Copia del registro con los OsintHit como dicts (solo para JSON)."""
+    if not res.get("osint"):
+        return res
+    return {**res, "osint": [hit.to_dict() for hit in res["osint"]]}
+
 # Colores para terminal
 class Colors:
     HEADER = '\033[95m'
@@ -38,18 +76,44 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Barras y banners precalculados (se repintan en cada menú)
+_EQ60 = "=" * 60
+_HEADER_BAR = f"{Colors.BOLD}{Colors.CYAN}{_EQ60}{Colors.ENDC}"
+_GREEN_BAR = f"{Colors.BOLD}{Colors.GREEN}{_EQ60}{Colors.ENDC}"
+_QUICK_TOP = f"{Colors.BOLD}{Colors.GREEN}╔{'═'*58}╗{Colors.ENDC}"
+_QUICK_BOTTOM = f"{Colors.BOLD}{Colors.GREEN}╚{'═'*58}╝{Colors.ENDC}"
+_BANNER = """
+    ███╗   ██╗██╗   ██╗███╗   ██╗███╗   ███╗███████╗██████╗ ██████╗  ██████╗ ██╗  ██╗
+    ████╗  ██║██║   ██║████╗  ██║████╗ ████║██╔════╝██╔══██╗██╔══██╗██╔═══██╗╚██╗██╔╝
+    ██╔██╗ ██║██║   ██║██╔██╗ ██║██╔████╔██║█████╗  ██████╔╝██║  ██║██║   ██║ ╚███╔╝ 
+    ██║╚██╗██║██║   ██║██║╚██╗██║██║╚██╔╝██║██╔══╝  ██╔══██╗██║  ██║██║   ██║ ██╔██╗ 
+    ██║ ╚████║╚██████╔╝██║ ╚████║██║ ╚═╝ ██║███████╗██║  ██║██████╔╝╚██████╔╝██╔╝ ██╗
+    ╚═╝  ╚═══╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝     ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝  ╚═════╝ ╚═╝  ╚═╝
+    """
+
 app = typer.Typer(
     help="Nunmerdox - Scanner e OSINT de números telefónicos",
     rich_markup_mode="markdown"
 )
 
 
-def parse_phone_number(number: str) -> Optional[dict]:
+@lru_cache(maxsize=None)
+def _get_phonenumbers():
+    """Importa phonenumbers bajo demanda (sus metadatos retrasan el arranque)."""
+    import phonenumbers
+    return phonenumbers
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(number: str) -> Optional[Tuple[str, str, str]]:
     """
-    Parsea un número telefónico usando phonenumbers.
+    Parsea y valida un número; retorna (e164, intl, country) o None.
     
-    Retorna dict con: e164, country, intl
+    phonenumbers.parse es puro para (number, "ES"), así que el resultado
+    se puede cachear. Se retorna una tupla inmutable para que los
+    llamadores no puedan modificar la entrada cacheada.
     """
+    phonenumbers = _get_phonenumbers()
     try:
         # Intentar parsear con referencia por defecto (España)
         parsed = phonenumbers.parse(number, "ES")
@@ -58,39 +122,99 @@ def parse_phone_number(number: str) -> Optional[dict]:
             logger.warning(f"Número inválido: {number}")
             return None
         
-        return {
-            "e164": phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
-            "intl": phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL),
-            "country": phonenumbers.region_code_for_number(parsed),
-            "valid": True
-        }
+        return (
+            phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
+            phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL),
+            phonenumbers.region_code_for_number(parsed),
+        )
     except phonenumbers.phonenumberutil.NumberParseException as e:
         logger.error(f"Error al parsear {number}: {e}")
         return None
 
 
+def parse_phone_number(number: str) -> Optional[dict]:
+    """
+    Parsea un número telefónico usando phonenumbers.
+    
+    Retorna dict con: e164, country, intl
+    """
+    if not (
+        _PHONE_RE.fullmatch(number.strip())
+        and _PHONE_MIN_DIGITS <= sum(c.isdigit() for c in number) <= _PHONE_MAX_DIGITS
+    ):
+        logger.warning(f"Formato de número no reconocido: {number}")
+        return None
+    
+    parsed = _parse_cached(number)
+    if parsed is None:
+        return None
+    
+    e164, intl, country = parsed
+    return {
+        "e164": e164,
+        "intl": intl,
+        "country": country,
+        "valid": True
+    }
+
+
+def _keypress_reader(options: dict) -> Optional[Callable[[str], object]]:
+    """
+    Lector de opción con una sola tecla (prompt_toolkit), sin esperar Enter.
+    
+    Retorna None (usar input()) si prompt_toolkit no está instalado, si no
+    hay TTY o si alguna opción no cabe en una tecla (1-9).
+    """
+    if not (sys.stdin.isatty() and sys.stdout.isatty()):
+        return None
+    if not all(isinstance(num, int) and 1 <= num <= 9 for num in options):
+        return None
+    
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.formatted_text import ANSI
+        from prompt_toolkit.key_binding import KeyBindings
+    except ImportError:  # Dependencia opcional (pip install nunmerdox[tui])
+        return None
+    
+    kb = KeyBindings()
+    for num in options:
+        @kb.add(str(num))
+        def _(event, num=num):
+            event.app.exit(result=num)
+    
+    session = PromptSession(key_bindings=kb)
+    return lambda prompt: session.prompt(ANSI(prompt))
+
+
 def print_menu(title: str, options: dict) -> int:
     """
     Muestra un menú numerado y retorna la opción seleccionada.
     
     Args:
         title: Título del menú
-        options: Dict {número: descripción}
+        options: Dict {número: descripción}, mostrado en orden de inserción
     
     Returns:
         Número de opción seleccionada
     """
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{title}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}")
+    # Todo el menú en un solo write (menos syscalls en TTYs lentos / SSH)
+    lines = ["", _HEADER_BAR, f"{Colors.BOLD}{Colors.HEADER}{title}{Colors.ENDC}", _HEADER_BAR]
+    lines += [f"  {Colors.BOLD}{num}{Colors.ENDC}. {desc}" for num, desc in options.items()]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     
-    for num, desc in sorted(options.items()):
-        print(f"  {Colors.BOLD}{num}{Colors.ENDC}. {desc}")
+    prompt = f"\n{Colors.GREEN}Selecciona opción: {Colors.ENDC}"
+    read_keypress = _keypress_reader(options)
     
     while True:
         try:
-            choice = input(f"\n{Colors.GREEN}Selecciona opción: {Colors.ENDC}").strip()
-            choice_int = int(choice)
+            if read_keypress:
+                # Retorna la opción en cuanto se pulsa la tecla
+                choice = read_keypress(prompt)
+            else:
+                choice = input(prompt)
+            choice_int = int(str(choice).strip())
             if choice_int in options:
                 return choice_int
             else:
@@ -102,9 +226,9 @@ def print_menu(title: str, options: dict) -> int:
 def quick_mode():
     """Modo rápido: solo pide número y lanza OSINT automáticamente."""
     
-    print(f"\n{Colors.BOLD}{Colors.GREEN}╔{'═'*58}╗{Colors.ENDC}")
+    print(f"\n{_QUICK_TOP}")
     print(f"{Colors.BOLD}{Colors.GREEN}║ NUNMERDOX - OSINT Scanner de Números Telefónicos{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.GREEN}╚{'═'*58}╝{Colors.ENDC}\n")
+    print(f"{_QUICK_BOTTOM}\n")
     
     print(f"{Colors.YELLOW}⚠️  ADVERTENCIA LEGAL ⚠️{Colors.ENDC}")
     print("Solo para pentesting, OSINT ético e investigación autorizada.\n")
@@ -125,20 +249,15 @@ def quick_mode():
 def interactive_mode():
     """Modo interactivo para ejecutar Nunmerdox sin argumentos CLI."""
     
-    print(f"\n{Colors.BOLD}{Colors.HEADER}")
-    print("""
-    ███╗   ██╗██╗   ██╗███╗   ██╗███╗   ███╗███████╗██████╗ ██████╗  ██████╗ ██╗  ██╗
-    ████╗  ██║██║   ██║████╗  ██║████╗ ████║██╔════╝██╔══██╗██╔══██╗██╔═══██╗╚██╗██╔╝
-    ██╔██╗ ██║██║   ██║██╔██╗ ██║██╔████╔██║█████╗  ██████╔╝██║  ██║██║   ██║ ╚███╔╝ 
-    ██║╚██╗██║██║   ██║██║╚██╗██║██║╚██╔╝██║██╔══╝  ██╔══██╗██║  ██║██║   ██║ ██╔██╗ 
-    ██║ ╚████║╚██████╔╝██║ ╚████║██║ ╚═╝ ██║███████╗██║  ██║██████╔╝╚██████╔╝██╔╝ ██╗
-    ╚═╝  ╚═══╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝     ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝  ╚═════╝ ╚═╝  ╚═╝
-    """)
-    print(f"{Colors.ENDC}")
-    
-    print(f"{Colors.YELLOW}⚠️  ADVERTENCIA LEGAL ⚠️{Colors.ENDC}")
-    print("Este software es para pentesting, OSINT ético e investigación autorizada.")
-    print("Uso no autorizado = responsabilidad legal del usuario.\n")
+    sys.stdout.write("\n".join([
+        f"\n{Colors.BOLD}{Colors.HEADER}",
+        _BANNER,
+        f"{Colors.ENDC}",
+        f"{Colors.YELLOW}⚠️  ADVERTENCIA LEGAL ⚠️{Colors.ENDC}",
+        "Este software es para pentesting, OSINT ético e investigación autorizada.",
+        "Uso no autorizado = responsabilidad legal del usuario.\n",
+    ]) + "\n")
+    sys.stdout.flush()
     
     # Sección 1: Entrada de números
     numbers = []
@@ -251,118 +370,246 @@ def interactive_mode():
             break
     
     # Sección 3: Ejecutar
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}")
+    print(f"\n{_HEADER_BAR}")
     print(f"{Colors.BOLD}Iniciando escaneo...{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
+    print(f"{_HEADER_BAR}\n")
     
     run_scan(numbers, osint_enabled, osint_max, osint_delay, output_format)
 
 
+def _dedupe_numbers(numbers: List[str]) -> List[dict]:
+    """
+    Parsea los números y agrupa los que normalizan al mismo E.164.
+    
+    Cada resultado guarda en "inputs" las entradas originales que lo
+    generaron, en el orden de la primera aparición.
+    """
+    unique: dict = {}
+    
+    for number in numbers:
+        res = parse_phone_number(number)
+        
+        if not res:
+            logger.warning(f"No se pudo procesar: {number}")
+            continue
+        
+        if res["e164"] in unique:
+            unique[res["e164"]]["inputs"].append(number)
+        else:
+            res["inputs"] = [number]
+            unique[res["e164"]] = res
+    
+    return list(unique.values())
+
+
 def run_scan(
     numbers: List[str],
     osint: bool = False,
     osint_max: int = 5,
     osint_delay: float = 1.0,
-    output: Optional[str] = None
+    output: Optional[str] = None,
+    use_cache: bool = True,
+    osint_backend: str = "html"
 ):
     """Ejecuta el escaneo con los parámetros dados."""
-    results = []
-    
-    with typer.progressbar(numbers, label="Escaneando números...") as progress:
-        for number in progress:
-            res = parse_phone_number(number)
-            
-            if not res:
-                logger.warning(f"No se pudo procesar: {number}")
-                continue
-            
-            # Ejecutar OSINT si está activado
-            if osint:
-                try:
-                    typer.echo(f"\n{Colors.CYAN}🔍 Ejecutando OSINT para {res['e164']}...{Colors.ENDC}")
-                    osint_data = perform_osint(
-                        res["e164"],
-                        res.get("intl"),
-                        max_results=osint_max,
-                        delay=osint_delay
-                    )
-                    res["osint"] = osint_data
-                    typer.echo(
-                        f"   {Colors.GREEN}✓ {len(osint_data)} resultados encontrados{Colors.ENDC}"
-                    )
-                except Exception as e:
-                    logger.exception(f"Error en OSINT para {res.get('e164')}")
-                    res["osint_error"] = str(e)
-            
-            results.append(res)
+    # Deduplicar antes del OSINT: cada E.164 se busca una sola vez
+    records = _dedupe_numbers(numbers)
+    
+    with ResultSink(output) as sink, \
+            typer.progressbar(length=len(records), label="Escaneando números...") as progress:
+        if not osint:
+            for res in records:
+                sink.write(res)
+                progress.update(1)
+        else:
+            _run_osint_batch(
+                records, sink, progress, osint_max, osint_delay, use_cache, osint_backend
+            )
     
-    # Guardar resultados
     if output:
-        save_results(results, output)
         typer.echo(f"\n{Colors.GREEN}✅ Resultados guardados en: {output}{Colors.ENDC}")
-    else:
-        # Mostrar en consola
-        print(f"\n{Colors.BOLD}{Colors.GREEN}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.BOLD}RESULTADOS{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.GREEN}{'='*60}{Colors.ENDC}")
-        for res in results:
-            print(json.dumps(res, indent=2, ensure_ascii=False))
 
 
-def save_results(results: List[dict], filepath: str):
-    """Guarda resultados en JSON, TXT o CSV según extensión."""
-    path = Path(filepath)
-    
-    if path.suffix.lower() == ".json":
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-    
-    elif path.suffix.lower() == ".txt":
-        with open(path, "w", encoding="utf-8") as f:
-            for res in results:
-                f.write(f"{'='*60}\n")
-                f.write(f"Número: {res.get('e164', 'N/A')}\n")
-                f.write(f"País: {res.get('country', 'N/A')}\n")
-                f.write(f"Formato Intl: {res.get('intl', 'N/A')}\n")
-                
-                if res.get("osint"):
-                    f.write(f"\nResultados OSINT ({len(res['osint'])} hallazgos):\n")
-                    f.write("-" * 60 + "\n")
-                    
-                    for i, r in enumerate(res["osint"], 1):
-                        f.write(f"\n{i}. Query: {r.get('query', 'N/A')}\n")
-                        f.write(f"   Título: {r.get('title', 'N/A')}\n")
-                        f.write(f"   URL: {r.get('href', 'N/A')}\n")
-                        f.write(f"   Snippet: {r.get('body', 'N/A')}\n")
-                
-                if res.get("osint_error"):
-                    f.write(f"\n⚠️ Error OSINT: {res['osint_error']}\n")
-                
-                f.write("\n")
+def _run_osint_batch(
+    records: List[dict],
+    sink: "ResultSink",
+    progress,
+    osint_max: int = 5,
+    osint_delay: float = 1.0,
+    use_cache: bool = True,
+    osint_backend: str = "html"
+):
+    """Ejecuta el OSINT de todos los números y los vuelca al sink en orden."""
+    # Resultados terminados fuera de orden, a la espera de los anteriores
+    pending: dict = {}
+    next_index = 0
+    
+    def _on_result(index: int, hits: list, error: Optional[Exception]):
+        nonlocal next_index
+        res = records[index]
+        
+        if error is not None:
+            logger.error(f"Error en OSINT para {res['e164']}: {error}", exc_info=error)
+            res["osint_error"] = str(error)
+        else:
+            res["osint"] = hits
+            typer.echo(
+                f"   {Colors.GREEN}✓ {len(hits)} resultados encontrados ({res['e164']}){Colors.ENDC}"
+            )
+        
+        pending[index] = res
+        progress.update(1)
+        
+        # Volcar cada resultado en cuanto están listos todos los anteriores,
+        # así la salida conserva el orden de entrada sin acumular la lista
+        while next_index in pending:
+            sink.write(pending.pop(next_index))
+            next_index += 1
+    
+    # Import diferido: el motor OSINT (httpx, bs4, requests) solo se carga si se usa
+    from .osint import perform_osint_batch
+    
+    typer.echo(f"\n{Colors.CYAN}🔍 Ejecutando OSINT para {len(records)} número(s)...{Colors.ENDC}")
+    # Un único cliente (y event loop) para todo el lote
+    perform_osint_batch(
+        [(res["e164"], res.get("intl")) for res in records],
+        on_result=_on_result,
+        max_results=osint_max,
+        delay=osint_delay,
+        use_cache=use_cache,
+        backend=osint_backend
+    )
+
+
+class ResultSink:
+    """
+    Escribe resultados a disco (o consola) a medida que se generan.
+    
+    El formato se elige por extensión: .json (array), .ndjson/.jsonl
+    (un objeto por línea), .txt o .csv. Sin fichero, muestra en consola
+    al cerrar el sink, para no mezclarse con la barra de progreso ni con
+    los mensajes del escaneo.
+    
+    Uso:
+        with ResultSink("resultados.csv") as sink:
+            sink.write(res)
+    """
     
-    elif path.suffix.lower() == ".csv":
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "E164", "País", "Intl", "Query OSINT", "Título", "URL", "Snippet"
+    def __init__(self, filepath: Optional[str] = None):
+        self.path = Path(filepath) if filepath else None
+        self.fmt = self.path.suffix.lower() if self.path else None
+        self._file = None
+        self._writer = None
+        self._count = 0
+        self._console: List[dict] = []
+    
+    def __enter__(self) -> "ResultSink":
+        # Sin fichero (consola) no hay nada que abrir: se muestra en __exit__
+        if self.fmt in (".json", ".ndjson", ".jsonl"):
+            # Binario: orjson produce bytes UTF-8 directamente
+            self._file = open(self.path, "wb", buffering=OUTPUT_BUFFER_SIZE)
+            if self.fmt == ".json":
+                self._file.write(b"[")
+        
+        elif self.fmt == ".txt":
+            # Buffer de 1 MiB: menos syscalls en lotes grandes
+            self._file = open(self.path, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE)
+        
+        elif self.fmt == ".csv":
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow([
+                "E164", "País", "Intl", "Query OSINT", "Título", "URL", "Snippet", "Entradas"
             ])
+        
+        return self
+    
+    def write(self, res: dict):
+        """Escribe un resultado."""
+        if self.path is None:
+            self._console.append(res)
+        
+        elif self.fmt == ".json":
+            # Mismo formato que json.dump(lista, indent=2), registro a registro
+            record = _dumps(_jsonable(res), indent=True).replace(b"\n", b"\n  ")
+            self._file.write((b"\n  " if self._count == 0 else b",\n  ") + record)
+        
+        elif self.fmt in (".ndjson", ".jsonl"):
+            self._file.write(_dumps(_jsonable(res)) + b"\n")
+        
+        elif self.fmt == ".txt":
+            # Un solo write por registro
+            parts = [
+                _EQ60,
+                f"Número: {res.get('e164', 'N/A')}",
+                f"Entradas: {', '.join(res.get('inputs', [])) or 'N/A'}",
+                f"País: {res.get('country', 'N/A')}",
+                f"Formato Intl: {res.get('intl', 'N/A')}",
+            ]
             
-            for res in results:
-                e164 = res.get("e164", "")
-                pais = res.get("country", "")
-                intl = res.get("intl", "")
+            if res.get("osint"):
+                parts.append(f"\nResultados OSINT ({len(res['osint'])} hallazgos):")
+                parts.append("-" * 60)
                 
-                if res.get("osint"):
-                    for r in res["osint"]:
-                        writer.writerow([
-                            e164, pais, intl,
-                            r.get("query", ""),
-                            r.get("title", ""),
-                            r.get("href", ""),
-                            r.get("body", "")
-                        ])
-                else:
-                    writer.writerow([e164, pais, intl, "", "", "", ""])
+                for i, r in enumerate(res["osint"], 1):
+                    parts.append(
+                        f"\n{i}. Query: {r.query}\n"
+                        f"   Título: {r.title}\n"
+                        f"   URL: {r.href}\n"
+                        f"   Snippet: {r.body}"
+                    )
+            
+            if res.get("osint_error"):
+                parts.append(f"\n⚠️ Error OSINT: {res['osint_error']}")
+            
+            self._file.write("\n".join(parts) + "\n\n")
+        
+        elif self.fmt == ".csv":
+            e164 = res.get("e164", "")
+            pais = res.get("country", "")
+            intl = res.get("intl", "")
+            entradas = "; ".join(res.get("inputs", []))
+            
+            if res.get("osint"):
+                # writerows itera en C; el generador evita materializar las filas
+                self._writer.writerows(
+                    (
+                        e164, pais, intl,
+                        r.query, r.title, r.href, r.body,
+                        entradas
+                    )
+                    for r in res["osint"]
+                )
+            else:
+                self._writer.writerow([e164, pais, intl, "", "", "", "", entradas])
+        
+        self._count += 1
+    
+    def __exit__(self, exc_type, exc, tb):
+        if self.path is None:
+            # Mostrar en consola
+            print(f"\n{_GREEN_BAR}")
+            print(f"{Colors.BOLD}RESULTADOS{Colors.ENDC}")
+            print(_GREEN_BAR)
+            for res in self._console:
+                print(json.dumps(_jsonable(res), indent=2, ensure_ascii=False))
+            self._console = []
+            return
+        
+        if self._file is None:
+            return
+        
+        if self.fmt == ".json":
+            self._file.write(b"\n]" if self._count else b"]")
+        self._file.close()
+        self._file = None
+
+
+def save_results(results: List[dict], filepath: str):
+    """Guarda resultados en JSON, NDJSON, TXT o CSV según extensión."""
+    with ResultSink(filepath) as sink:
+        for res in results:
+            sink.write(res)
 
 
 @app.command()
@@ -389,18 +636,33 @@ def scan(
     osint_delay: float = typer.Option(
         1.0,
         "--osint-delay",
-        help="Delay entre queries OSINT en segundos (default 1.0)"
+        help="Intervalo medio entre queries OSINT en segundos (default 1.0, se adapta si DuckDuckGo limita)"
     ),
     output: Optional[str] = typer.Option(
         None,
         "--output", "-o",
-        help="Archivo de salida (JSON, TXT, CSV)"
+        help="Archivo de salida (JSON, NDJSON, TXT, CSV)"
+    ),
+    osint_backend: str = typer.Option(
+        "html",
+        "--osint-backend",
+        help="Backend DuckDuckGo: html (más resultados) o api (JSON, sin parseo HTML)"
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignorar la caché OSINT en disco y repetir todas las búsquedas"
     ),
     interactive: bool = typer.Option(
         False,
         "--interactive", "-i",
         help="Modo interactivo avanzado con menús completos"
     ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose", "-v",
+        help="Mostrar logs de depuración (incluye el detalle de cada query fallida)"
+    ),
 ):
     """
     Escanea números telefónicos y ejecuta búsquedas OSINT.
@@ -428,6 +690,11 @@ def scan(
     ```
     """
     
+    if verbose:
+        # Solo el paquete (y una línea por petición de httpx), no el logger raíz
+        logging.getLogger("nunmerdox").setLevel(logging.DEBUG)
+        logging.getLogger("httpx").setLevel(logging.INFO)
+    
     # Sin argumentos: modo rápido
     if not numbers and not interactive:
         quick_mode()
@@ -450,7 +717,16 @@ def scan(
         typer.echo("❌ osint-max debe ser > 0 y osint-delay >= 0", err=True)
         raise typer.Exit(1)
     
-    run_scan(numbers, osint, osint_max, osint_delay, output)
+    if osint:
+        from .osint import BACKENDS
+        if osint_backend not in BACKENDS:
+            typer.echo(f"❌ osint-backend debe ser uno de: {', '.join(BACKENDS)}", err=True)
+            raise typer.Exit(1)
+    
+    run_scan(
+        numbers, osint, osint_max, osint_delay, output,
+        use_cache=not no_cache, osint_backend=osint_backend
+    )
 
 
 if __name__ == "__main__":
@@ -9,12 +9,42 @@ ADVERTENCIA LEGAL:
 - El usuario es responsable de uso legal y autorizado.
 """
 
-from typing import List, Dict, Any, Optional
-import time
+# PERF NOTES
+# ----------
+# El coste de un escaneo es casi todo latencia de red: RTT + TLS de cada query
+# a DuckDuckGo más la pausa de cortesía. El trabajo de CPU (formatear strings,
+# parsear HTML, phonenumbers, que ya es código nativo) es una fracción mínima.
+#
+# Por eso NO se aceptan PRs que añadan Numba u otro JIT: @njit no compila
+# strings, dicts heterogéneos, BeautifulSoup ni llamadas a extensiones C, y su
+# import + compilación (segundos) empeoraría el arranque de la CLI.
+#
+# Las palancas correctas son las de I/O, y son las que usa este paquete:
+# - asyncio + httpx para solapar las queries de un número (perform_osint_async)
+# - un único OsintClient (conexión y event loop) para todo un lote de números
+#   (perform_osint_batch, usado por cli.run_scan)
+# - un token bucket adaptativo (TokenBucket) que marca el ritmo real de
+#   peticiones en lugar de dormir un tiempo fijo tras cada una
+# - caché en disco (cache.OsintCache) para no repetir búsquedas
+
+from typing import Callable, List, Dict, Any, NamedTuple, Optional, Sequence, Tuple, Union
+from concurrent.futures import Executor
+from functools import lru_cache
+import asyncio
+import importlib.util
+import json
 import logging
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import quote
+import re
+import time
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import orjson
+except ImportError:  # Dependencia opcional (pip install nunmerdox[fast])
+    orjson = None
+
+from .cache import OsintCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +54,74 @@ USER_AGENT = (
     "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 )
 
+# Compresión de respuestas: Brotli solo si hay decodificador instalado
+# (httpx y urllib3 usan brotli o brotlicffi); si no, gzip
+ACCEPT_ENCODING = (
+    "gzip, br"
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    else "gzip"
+)
+
+# Parser HTML: lxml (C, mucho más rápido) si está instalado, si no el de la stdlib
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Solo interesan enlaces y celdas de la página de resultados
+_LITE_STRAINER = SoupStrainer(name=["a", "td"])
+
+# Enlaces y snippets de resultado, en orden de documento
+_SEL_LITE = "a.result-link, td.result-snippet"
+
+# Los enlaces patrocinados pasan por el redirector de anuncios
+_AD_MARKER = "duckduckgo.com/y.js"
+
+# Versión lite: HTML mucho más pequeño y casi tabular, y menos bloqueos
+DDG_LITE_URL = "https://lite.duckduckgo.com/lite/"
+DDG_API_URL = "https://api.duckduckgo.com/"
+
+# Queries simultáneas por número (DuckDuckGo bloquea por encima de ~5-6 req/10s)
+DEFAULT_CONCURRENCY = 3
+
+# Timeout por petición (segundos)
+REQUEST_TIMEOUT = 10
+
+# Respuestas con las que DuckDuckGo indica que está limitando peticiones
+RATE_LIMIT_STATUSES = (202, 403, 429)
+DEFAULT_MAX_RETRIES = 2
+
+# E.164 buscable: '+' y de 7 a 15 dígitos; con menos no hay resultados útiles
+_E164_RE = re.compile(r"\+\d{7,15}")
+
+# Plantillas de query ({e} = número E.164), distintas entre sí por construcción.
+# Redes sociales, pastes y términos de contacto agrupados con OR:
+# misma cobertura en 2 queries en lugar de 9 (menos rate-limit)
+_QUERY_TEMPLATES = (
+    '"{e}"',
+    '"{e}" (facebook OR twitter OR instagram OR whatsapp OR linkedin OR reddit OR pastebin)',
+    '"{e}" ("contacto" OR "teléfono")',
+)
+
+
+class OsintHit(NamedTuple):
+    """
+    Resultado OSINT: la query que lo encontró y el enlace hallado.
+    
+    Inmutable y sin dict por instancia; a diferencia de un dataclass con
+    __slots__ hechos a mano, se copia y se serializa con pickle (p. ej. entre
+    procesos). Los parsers lo crean directamente y viaja tal cual hasta la
+    salida; to_dict() solo se usa al serializar a JSON.
+    """
+    
+    query: str
+    title: str
+    href: str
+    body: str
+    
+    def to_dict(self) -> Dict[str, str]:
+        return self._asdict()
+
 
-def build_osint_queries(e164: str, intl: Optional[str] = None) -> List[str]:
+@lru_cache(maxsize=4096)
+def build_osint_queries(e164: str, intl: Optional[str] = None) -> Tuple[str, ...]:
     """
     Construye una lista de queries OSINT para buscar un número en la web.
     
@@ -34,137 +130,709 @@ def build_osint_queries(e164: str, intl: Optional[str] = None) -> List[str]:
         intl: Número en formato internacional legible (ej: +34 123 456 789)
     
     Returns:
-        Lista de queries deduplicadas ordenadas.
+        Tupla (inmutable, se cachea) de queries sin duplicados.
+    """
+    q = [t.format(e=e164) for t in _QUERY_TEMPLATES]
+    
+    # El formato internacional va justo detrás de la query exacta
+    if intl and intl != e164:
+        q.insert(1, f'"{intl}"')
+    
+    return tuple(q)
+
+
+def _parse_results(content: bytes, max_results: int, query: str = "") -> List[OsintHit]:
+    """
+    Extrae los resultados de la página lite de DuckDuckGo.
+    
+    Cada resultado es un enlace `a.result-link` seguido de su
+    `td.result-snippet`. Solo se construyen en el árbol las etiquetas
+    <a> y <td> (SoupStrainer), y se recorren en una sola pasada en orden
+    de documento: cada snippet pertenece al último enlace visto.
+    
+    Args:
+        content: HTML de la respuesta
+        max_results: Máximo de resultados a retornar
+        query: Query de origen (se guarda en cada OsintHit)
+    
+    Returns:
+        Lista de OsintHit etiquetados con la query
+    """
+    results: List[OsintHit] = []
+    dropped = 0
+    # Enlace en curso (título, URL), a la espera de su snippet: el OsintHit
+    # se crea una sola vez, ya completo
+    pending: Optional[Tuple[str, str]] = None
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=_LITE_STRAINER)
+    
+    for elem in soup.select(_SEL_LITE):
+        if elem.name == 'td':
+            # Snippet del resultado en curso (ninguno si era un anuncio o inválido)
+            if pending is not None:
+                results.append(OsintHit(query, *pending, elem.get_text(' ', strip=True)))
+                pending = None
+            continue
+        
+        # El resultado anterior no tenía snippet
+        if pending is not None:
+            results.append(OsintHit(query, *pending, ''))
+            pending = None
+        
+        if len(results) >= max_results:
+            break
+        
+        # Título y URL
+        href = elem.get('href', '')
+        title = elem.get_text(strip=True)
+        
+        # Anuncios patrocinados y filas sin enlace o sin título
+        if not href or not title or _AD_MARKER in href:
+            dropped += 1
+            continue
+        
+        pending = (title, href)
+    
+    if pending is not None:
+        results.append(OsintHit(query, *pending, ''))
+    
+    # Una sola línea por query, no una por fila descartada
+    if dropped:
+        logger.debug("Descartados %d resultados (anuncios o sin título/URL) para %r", dropped, query)
+    
+    return results
+
+
+def _parse_api_results(content: bytes, max_results: int, query: str = "") -> List[OsintHit]:
+    """
+    Extrae los resultados de la API JSON (Instant Answer) de DuckDuckGo.
+    
+    No hay parseo HTML, pero la API solo devuelve resúmenes y temas
+    relacionados, no resultados web: suele encontrar menos que el HTML.
+    
+    Args:
+        content: JSON de la respuesta
+        max_results: Máximo de resultados a retornar
+        query: Query de origen (se guarda en cada OsintHit)
+    
+    Returns:
+        Lista de OsintHit etiquetados con la query
     """
-    q = []
+    data = orjson.loads(content) if orjson is not None else json.loads(content)
     
-    # Query base exacta
-    q.append(f'"{e164}"')
+    results: List[OsintHit] = []
+    dropped = 0
+    topics = list(data.get("Results", [])) + list(data.get("RelatedTopics", []))
+    
+    while topics and len(results) < max_results:
+        topic = topics.pop(0)
+        
+        # Las categorías agrupan temas en "Topics"
+        if "Topics" in topic:
+            topics[:0] = topic["Topics"]
+            continue
+        
+        href = topic.get("FirstURL", "")
+        body = topic.get("Text", "")
+        if href and body:
+            results.append(OsintHit(query, body.split(" - ", 1)[0], href, body))
+        else:
+            dropped += 1
+    
+    if dropped:
+        logger.debug("Descartados %d temas sin URL o texto para %r", dropped, query)
+    
+    return results
+
+
+class _LiteProgress:
+    """
+    Indica si una descarga parcial de la página lite ya contiene
+    max_results resultados completos.
+    
+    Cuando aparece el enlace del resultado N+1, el snippet del N ya ha
+    llegado. Los enlaces de anuncios (y.js) no cuentan.
+    
+    Se llama tras cada chunk con el buffer acumulado (una instancia por
+    descarga) y solo cuenta en la parte nueva, más el solape necesario
+    para no perder un marcador partido entre dos chunks: lineal en el
+    tamaño de la respuesta, no cuadrático.
+    """
+    
+    _LINKS = (b"class='result-link'", b'class="result-link"')
+    _ADS = b"/y.js"
+    
+    def __init__(self, max_results: int):
+        self.max_results = max_results
+        self._links = 0
+        self._ads = 0
+        self._scanned = 0
+    
+    def _count(self, content: bytes, marker: bytes) -> int:
+        # Las apariciones que empiezan antes de este punto ya cabían enteras
+        # en el buffer anterior (y se contaron); las posteriores no
+        start = max(0, self._scanned - len(marker) + 1)
+        return content.count(marker, start)
+    
+    def __call__(self, content: bytes) -> bool:
+        self._links += sum(self._count(content, m) for m in self._LINKS)
+        self._ads += self._count(content, self._ADS)
+        self._scanned = len(content)
+        return self._links - self._ads > self.max_results
+
+
+# Backends de búsqueda: nombre -> (url, parámetros extra, parser, corte anticipado).
+# El corte anticipado se instancia con max_results para cada descarga
+BACKENDS = {
+    "html": (DDG_LITE_URL, {}, _parse_results, _LiteProgress),
+    "api": (
+        DDG_API_URL,
+        {"format": "json", "no_html": "1", "skip_disambig": "1"},
+        _parse_api_results,
+        None  # El JSON solo se puede parsear completo
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_session():
+    """
+    Sesión requests compartida con keep-alive y reintentos.
     
-    if intl:
-        q.append(f'"{intl}"')
+    Reutiliza conexiones TCP/TLS entre queries en lugar de abrir una por
+    llamada. Se crea bajo demanda: la CLI usa la ruta asíncrona (httpx).
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     
-    # Redes sociales y sitios comunes
-    q += [
-        f'{e164} facebook',
-        f'{e164} twitter',
-        f'{e164} instagram',
-        f'{e164} whatsapp',
-        f'{e164} "contacto"',
-        f'{e164} "teléfono"',
-        f'{e164} site:pastebin.com',
-        f'{e164} site:reddit.com',
-        f'{e164} site:linkedin.com',
-    ]
+    retry = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[202, 429, 500, 502, 503],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
     
-    # Dedupe preservando orden
-    seen = set()
-    out = []
-    for item in q:
-        if item not in seen:
-            seen.add(item)
-            out.append(item)
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING})
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _default_cache() -> OsintCache:
+    """
+    Caché en disco compartida del proceso.
     
-    return out
+    Una sola instancia: el directorio y el esquema se preparan una vez, no
+    en cada búsqueda.
+    """
+    return OsintCache()
+
+
+def _to_cache(hits: List[OsintHit]) -> List[Dict[str, str]]:
+    """Formato de la caché: la query ya forma parte de la clave."""
+    return [{"title": h.title, "href": h.href, "body": h.body} for h in hits]
 
 
-def search_duckduckgo(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+def _from_cache(query: str, items: List[Dict[str, str]]) -> List[OsintHit]:
+    return [OsintHit(query, **it) for it in items]
+
+
+def search_duckduckgo(
+    query: str,
+    max_results: int = 5,
+    use_cache: bool = True
+) -> List[OsintHit]:
     """
     Busca en DuckDuckGo usando una simple solicitud HTTP.
     
+    Comparte la caché en disco con la ruta asíncrona (backend "html").
+    
     Args:
         query: Término de búsqueda
         max_results: Máximo de resultados a retornar
+        use_cache: Reutilizar resultados guardados en la caché en disco
     
     Returns:
-        Lista de resultados: {title, href, body}
+        Lista de OsintHit
     """
-    results = []
+    import requests
+    
+    cache = _default_cache() if use_cache else None
+    key = OsintCache.make_key(f"html:{query}", max_results)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return _from_cache(query, cached)
     
     try:
-        # URL de búsqueda de DuckDuckGo HTML
-        url = "https://html.duckduckgo.com/"
-        params = {"q": query}
+        response = _get_session().get(DDG_LITE_URL, params={"q": query}, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
         
-        headers = {"User-Agent": USER_AGENT}
+        items = _parse_results(response.content, max_results, query)
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
+        # Solo se cachean respuestas completas (202 = DuckDuckGo limitando)
+        if cache is not None and response.status_code == 200:
+            cache.set(key, _to_cache(items))
+        return items
         
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
+    except requests.exceptions.RequestException as e:
+        logger.warning("Error en búsqueda DuckDuckGo para %r: %s", query, e)
+    except Exception as e:
+        logger.exception("Error inesperado en búsqueda: %s", e)
+    
+    return []
+
+
+def _make_client(concurrency: int = DEFAULT_CONCURRENCY) -> httpx.AsyncClient:
+    """
+    Cliente httpx para las búsquedas asíncronas.
+    
+    Todas las queries van al mismo host, así que con HTTP/2 comparten una
+    sola conexión TCP/TLS (streams multiplexados, cabeceras comprimidas
+    con HPACK). Los límites solo acotan el fallback a HTTP/1.1.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING},
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    )
+
+
+class TokenBucket:
+    """
+    Limitador de ritmo (token bucket) compartido por todas las peticiones
+    de un cliente.
+    
+    Cada petición consume un token; los tokens se reponen a `rate` por
+    segundo hasta `capacity` (la ráfaga inicial permitida). El ritmo se
+    adapta a DuckDuckGo: se reduce a la mitad cuando limita peticiones
+    (on_throttle) y vuelve a subir poco a poco hacia el máximo configurado
+    con cada respuesta correcta (on_success).
+    
+    Con rate=None no se limita nada.
+    """
+    
+    # Suelo del ritmo adaptativo, en fracción del máximo
+    MIN_RATE_FACTOR = 1 / 16
+    # Fracción del máximo recuperada por cada respuesta correcta
+    RECOVERY_STEP = 1 / 8
+    
+    def __init__(self, rate: Optional[float], capacity: float = 1.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+    
+    @classmethod
+    def from_delay(cls, delay: float, capacity: float = 1.0) -> "TokenBucket":
+        """Bucket con una petición cada `delay` segundos de media (0 = sin límite)."""
+        return cls(1.0 / delay if delay > 0 else None, capacity)
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+    
+    async def acquire(self):
+        """Espera hasta que haya un token disponible y lo consume."""
+        if self.rate is None:
+            return
         
-        # Buscar resultados
-        for result in soup.find_all('div', class_='result'):
-            if len(results) >= max_results:
-                break
-            
-            try:
-                # Título y URL
-                link = result.find('a', class_='result__url')
-                if not link:
-                    continue
-                
-                href = link.get('href', '')
-                title_elem = result.find('a', class_='result__title')
-                title = title_elem.get_text(strip=True) if title_elem else ''
-                
-                # Snippet
-                snippet_elem = result.find('a', class_='result__snippet')
-                body = snippet_elem.get_text(strip=True) if snippet_elem else ''
+        # Sin await entre comprobar y consumir: no hace falta lock en asyncio.
+        # Se recalcula en cada vuelta porque el ritmo puede cambiar mientras tanto
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def on_throttle(self):
+        """DuckDuckGo está limitando: reducir el ritmo a la mitad."""
+        if self.rate is None:
+            return
+        self._refill()
+        self.rate = max(self.max_rate * self.MIN_RATE_FACTOR, self.rate / 2)
+    
+    def on_success(self):
+        """Respuesta correcta: recuperar ritmo hacia el máximo configurado."""
+        if self.rate is None or self.rate >= self.max_rate:
+            return
+        self._refill()
+        self.rate = min(self.max_rate, self.rate + self.max_rate * self.RECOVERY_STEP)
+
+
+async def _fetch(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Dict[str, str],
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    enough: Optional[Callable[[bytes], bool]] = None,
+    bucket: Optional[TokenBucket] = None
+) -> bytes:
+    """
+    Descarga una página de resultados y retorna su contenido.
+    
+    La respuesta se lee en streaming: si `enough(contenido)` indica que ya
+    llegaron los resultados necesarios, se deja de descargar el resto.
+    
+    Cada intento espera su turno en `bucket`. Si DuckDuckGo limita
+    (RATE_LIMIT_STATUSES) se reduce el ritmo del bucket y se reintenta
+    hasta max_retries veces con backoff exponencial (1s, 2s, 4s...).
+    """
+    for attempt in range(max_retries + 1):
+        if bucket is not None:
+            await bucket.acquire()
+        
+        async with client.stream("GET", url, params=params) as response:
+            status = response.status_code
+            if status in RATE_LIMIT_STATUSES:
+                if bucket is not None:
+                    bucket.on_throttle()
+            else:
+                response.raise_for_status()
+                if bucket is not None:
+                    bucket.on_success()
                 
-                if href and title:
-                    results.append({
-                        "title": title,
-                        "href": href,
-                        "body": body
-                    })
-            except Exception as e:
-                logger.debug(f"Error parsing resultado: {e}")
+                content = bytearray()
+                async for chunk in response.aiter_bytes():
+                    content += chunk
+                    if enough is not None and enough(content):
+                        break
+                return bytes(content)
+        
+        if attempt < max_retries:
+            await asyncio.sleep(2 ** attempt)
+    
+    raise RuntimeError(f"DuckDuckGo limita las peticiones (HTTP {status})")
+
+
+async def _query(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    query: str,
+    max_results: int,
+    bucket: Optional[TokenBucket] = None,
+    cache: Optional[OsintCache] = None,
+    errors: Optional[List[Tuple[str, Exception]]] = None,
+    backend: str = "html",
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    parse_executor: Optional[Executor] = None
+) -> List[OsintHit]:
+    """
+    Versión asíncrona de search_duckduckgo, limitada por un semáforo compartido.
+    
+    El ritmo lo marca el token bucket compartido: no hay pausa fija tras
+    cada query, así una respuesta lenta no suma además el delay completo.
+    Los aciertos de caché no tocan la red ni esperan. Los fallos se añaden
+    a `errors` y solo se registran a nivel DEBUG (con traceback).
+    
+    Los reintentos por rate-limit (_fetch) no sueltan el slot del semáforo
+    para no seguir presionando al servidor. Sin parse_executor el parseo
+    se hace en línea: BeautifulSoup (también con lxml) ejecuta Python por
+    cada etiqueta y retiene el GIL, así que un pool de hilos solo añadiría
+    un salto de hilo por página. Para paralelismo real de CPU en lotes
+    grandes, pasar un ProcessPoolExecutor.
+    
+    La caché (SQLite, síncrona) se consulta en el pool de hilos del loop:
+    un disco lento o un lock de otro proceso no bloquea al resto del lote.
+    """
+    url, extra_params, parse, progress = BACKENDS[backend]
+    enough = progress(max_results) if progress else None
+    key = OsintCache.make_key(f"{backend}:{query}", max_results)
+    loop = asyncio.get_running_loop()
+    if cache is not None:
+        cached = await loop.run_in_executor(None, cache.get, key)
+        if cached is not None:
+            return _from_cache(query, cached)
+    
+    fetched = False
+    async with sem:
+        items: List[OsintHit] = []
+        try:
+            content = await _fetch(
+                client, url, {"q": query, **extra_params}, max_retries, enough, bucket
+            )
+            if parse_executor is None:
+                items = parse(content, max_results, query)
+            else:
+                items = await loop.run_in_executor(
+                    parse_executor, parse, content, max_results, query
+                )
+            fetched = True
+        except Exception as e:
+            # Sin tracebacks por query: en ráfagas de rate-limit saturan stderr
+            if errors is not None:
+                errors.append((query, e))
+            logger.debug("Error en búsqueda DuckDuckGo para %r: %s", query, e, exc_info=True)
+    
+    # _fetch solo retorna respuestas completas (nunca las de rate-limit).
+    # Se guarda ya fuera del semáforo: la escritura no retiene el slot
+    if cache is not None and fetched:
+        await loop.run_in_executor(None, cache.set, key, _to_cache(items))
+    
+    return items
+
+
+class OsintClient:
+    """
+    Cliente OSINT reutilizable entre muchos números.
+    
+    Mantiene un solo cliente httpx (conexión, TLS y DNS amortizados en todo
+    el lote), un semáforo y un token bucket comunes (concurrencia y ritmo
+    son globales, no por número) y la caché en disco.
+    
+    Uso:
+        async with OsintClient(max_results=5) as client:
+            hits = await client.lookup("+34123456789", "+34 123 45 67 89")
+    """
+    
+    def __init__(
+        self,
+        max_results: int = 5,
+        delay: float = 1.0,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        use_cache: bool = True,
+        backend: str = "html",
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        parse_executor: Optional[Executor] = None
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend OSINT desconocido: {backend!r} (opciones: {', '.join(BACKENDS)})")
+        if max_retries < 0:
+            raise ValueError(f"max_retries debe ser >= 0 (recibido: {max_retries})")
+        
+        self.max_results = max_results
+        self.delay = delay
+        self.concurrency = concurrency
+        self.backend = backend
+        self.max_retries = max_retries
+        self.parse_executor = parse_executor
+        self.cache = _default_cache() if use_cache else None
+        # Ritmo común a todo el lote; admite una ráfaga inicial de `concurrency`
+        self.bucket = TokenBucket.from_delay(delay, capacity=concurrency)
+        
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def __aenter__(self) -> "OsintClient":
+        self._ensure_open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def _ensure_open(self):
+        # El cliente y el semáforo pertenecen a un event loop concreto
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            # El cliente anterior no se puede cerrar desde otro loop (y el suyo
+            # quizá ya terminó): reemplazarlo en silencio dejaría conexiones abiertas
+            raise RuntimeError(
+                "OsintClient sigue abierto en otro event loop; "
+                "ciérralo con aclose() (o úsalo con `async with`) antes de cambiar de loop"
+            )
+        if self._client is None:
+            self._client = _make_client(self.concurrency)
+            self._sem = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+    
+    async def aclose(self):
+        """Cierra el cliente httpx (se reabre solo en el próximo lookup)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+    
+    async def lookup(self, e164: str, intl: Optional[str] = None) -> List[OsintHit]:
+        """
+        Ejecuta en paralelo las búsquedas DuckDuckGo relacionadas con el número.
+        
+        Args:
+            e164: Número E.164
+            intl: Número formato internacional
+        
+        Returns:
+            Lista de OsintHit (query, title, href, body)
+            (vacía, sin tocar la red, si e164 no es un número buscable)
+        """
+        if not e164 or not _E164_RE.fullmatch(e164):
+            logger.info("OSINT omitido, E.164 no válido: %r", e164)
+            return []
+        
+        self._ensure_open()
+        
+        queries = build_osint_queries(e164, intl)
+        errors: List[Tuple[str, Exception]] = []
+        
+        # return_exceptions: un fallo inesperado no cancela ni deja huérfanas al resto
+        batches = await asyncio.gather(
+            *[
+                _query(
+                    self._client, self._sem, q, self.max_results, self.bucket,
+                    self.cache, errors, self.backend, self.max_retries,
+                    self.parse_executor
+                )
+                for q in queries
+            ],
+            return_exceptions=True
+        )
+        
+        # gather conserva el orden de las queries
+        results: List[OsintHit] = []
+        for q, items in zip(queries, batches):
+            if isinstance(items, Exception):
+                errors.append((q, items))
+                logger.debug("Error en búsqueda DuckDuckGo para %r: %s", q, items, exc_info=items)
                 continue
+            results.extend(items)
         
-    except requests.exceptions.RequestException as e:
-        logger.warning(f"Error en búsqueda DuckDuckGo para '{query}': {e}")
-    except Exception as e:
-        logger.exception(f"Error inesperado en búsqueda: {e}")
+        if errors:
+            logger.warning(
+                "OSINT %s: %d/%d queries fallidas (usa --verbose para ver detalles)",
+                e164, len(errors), len(queries)
+            )
+        
+        return results
+
+
+_default_client: Optional[OsintClient] = None
+
+
+def get_client() -> OsintClient:
+    """
+    Cliente OSINT compartido del proceso, con las opciones por defecto.
     
-    return results
+    Pensado para código asíncrono que hace muchos lookups en un mismo
+    event loop; se crea la primera vez que se pide. El cliente queda ligado
+    al loop donde se usa: hay que cerrarlo antes de que ese loop termine,
+    normalmente con `async with get_client() as client:` dentro del loop
+    (después se puede reutilizar en otro).
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = OsintClient()
+    return _default_client
 
 
-def perform_osint(
+async def perform_osint_async(
     e164: str,
     intl: Optional[str] = None,
     max_results: int = 5,
-    delay: float = 1.0
-) -> List[Dict[str, Any]]:
+    delay: float = 1.0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_cache: bool = True,
+    backend: str = "html",
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    parse_executor: Optional[Executor] = None
+) -> List[OsintHit]:
     """
-    Ejecuta búsquedas DuckDuckGo para una lista de queries relacionadas con el número.
+    Ejecuta en paralelo las búsquedas DuckDuckGo relacionadas con el número.
     
     Args:
         e164: Número E.164
         intl: Número formato internacional
         max_results: Máximo número de resultados por query
-        delay: Delay en segundos entre queries
+        delay: Intervalo medio en segundos entre peticiones (ritmo adaptativo)
+        concurrency: Máximo de queries simultáneas
+        use_cache: Reutilizar resultados guardados en la caché en disco
+        backend: "html" (scraping, por defecto) o "api" (JSON Instant Answer)
+        max_retries: Reintentos por query cuando DuckDuckGo limita peticiones
+        parse_executor: Executor para parsear las respuestas (p. ej. un
+            ProcessPoolExecutor en lotes grandes); por defecto, en línea
     
     Returns:
-        Lista de dicts con keys: query, title, href, body
+        Lista de OsintHit (query, title, href, body)
     """
-    queries = build_osint_queries(e164, intl)
-    results: List[Dict[str, Any]] = []
+    async with OsintClient(
+        max_results, delay, concurrency, use_cache, backend, max_retries, parse_executor
+    ) as client:
+        return await client.lookup(e164, intl)
+
+
+async def perform_osint_batch_async(
+    numbers: Sequence[Union[str, Tuple[str, Optional[str]]]],
+    on_result: Optional[Callable[[int, List[OsintHit], Optional[Exception]], None]] = None,
+    **options: Any
+) -> List[Union[List[OsintHit], Exception]]:
+    """
+    Ejecuta el OSINT de varios números con un único OsintClient.
     
-    for q in queries:
-        try:
-            items = search_duckduckgo(q, max_results=max_results)
-            if items:
-                for it in items:
-                    results.append({
-                        "query": q,
-                        **it
-                    })
-        except Exception as e:
-            logger.exception(f"Error en búsqueda para query '{q}': {e}")
-        
-        time.sleep(delay)
+    Args:
+        numbers: Números E.164, o tuplas (e164, intl)
+        on_result: Callback on_result(índice, resultados, error) llamado en
+            cuanto termina cada número (en orden de finalización)
+        **options: Opciones de OsintClient (max_results, delay, ...)
     
-    return results
+    Returns:
+        Resultados por número en el orden de entrada; la excepción en
+        lugar de la lista si ese número falló
+    """
+    pairs = [(n, None) if isinstance(n, str) else n for n in numbers]
+    
+    async with OsintClient(**options) as client:
+        async def _one(index: int, e164: str, intl: Optional[str]):
+            try:
+                hits = await client.lookup(e164, intl)
+            except Exception as e:
+                if on_result is not None:
+                    on_result(index, [], e)
+                return e
+            if on_result is not None:
+                on_result(index, hits, None)
+            return hits
+        
+        return await asyncio.gather(
+            *[_one(i, e164, intl) for i, (e164, intl) in enumerate(pairs)]
+        )
+
 
+def perform_osint_batch(
+    numbers: Sequence[Union[str, Tuple[str, Optional[str]]]],
+    on_result: Optional[Callable[[int, List[OsintHit], Optional[Exception]], None]] = None,
+    **options: Any
+) -> List[Union[List[OsintHit], Exception]]:
+    """Envoltorio síncrono de perform_osint_batch_async."""
+    return asyncio.run(perform_osint_batch_async(numbers, on_result, **options))
+
+
+def perform_osint(
+    e164: str,
+    intl: Optional[str] = None,
+    max_results: int = 5,
+    delay: float = 1.0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_cache: bool = True,
+    backend: str = "html",
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    parse_executor: Optional[Executor] = None
+) -> List[OsintHit]:
+    """
+    Envoltorio síncrono de perform_osint_async.
+    
+    Args:
+        e164: Número E.164
+        intl: Número formato internacional
+        max_results: Máximo número de resultados por query
+        delay: Intervalo medio en segundos entre peticiones (ritmo adaptativo)
+        concurrency: Máximo de queries simultáneas
+        use_cache: Reutilizar resultados guardados en la caché en disco
+        backend: "html" (scraping, por defecto) o "api" (JSON Instant Answer)
+        max_retries: Reintentos por query cuando DuckDuckGo limita peticiones
+        parse_executor: Executor para parsear las respuestas (p. ej. un
+            ProcessPoolExecutor en lotes grandes); por defecto, en línea
+    
+    Returns:
+        Lista de OsintHit (query, title, href, body)
+    """
+    return asyncio.run(
+        perform_osint_async(
+            e164, intl, max_results, delay, concurrency, use_cache, backend, max_retries,
+            parse_executor
+        )
+    )
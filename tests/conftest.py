@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from nunmerdox import osint
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def lite_html() -> bytes:
+    """Página de resultados guardada de lite.duckduckgo.com (10 resultados + 2 anuncios)."""
+    return (FIXTURES / "ddg_lite.html").read_bytes()
+
+
+@pytest.fixture
+def mock_ddg(monkeypatch):
+    """
+    Sustituye la red por un handler httpx.MockTransport.
+    
+    Uso: requests = mock_ddg(handler); el handler recibe cada httpx.Request
+    (puede ser async) y retorna un httpx.Response. Retorna la lista de
+    peticiones recibidas.
+    """
+    def install(handler):
+        seen = []
+        
+        async def record(request):
+            seen.append(request)
+            response = handler(request)
+            if hasattr(response, "__await__"):
+                response = await response
+            return response
+        
+        monkeypatch.setattr(
+            osint, "_make_client",
+            lambda concurrency=osint.DEFAULT_CONCURRENCY: httpx.AsyncClient(
+                transport=httpx.MockTransport(record)
+            )
+        )
+        return seen
+    
+    return install
@@ -0,0 +1,69 @@
+"""
+Micro-benchmark: proporción I/O vs CPU de un escaneo OSINT.
+
+Respalda las PERF NOTES de osint.py: con una latencia de red realista, el
+tiempo de CPU (construir queries, parsear el HTML, phonenumbers) es una
+fracción pequeña del tiempo total, así que un JIT (Numba) no puede mejorar
+el escaneo de forma apreciable.
+
+Mide tiempos de reloj, así que no forma parte de la suite por defecto:
+    pytest -m perf -s
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from nunmerdox import cli, osint
+
+# Latencia simulada por petición (RTT + servidor). DuckDuckGo suele estar
+# bastante por encima; con un valor bajo la prueba es conservadora.
+SIMULATED_LATENCY = 0.1
+
+# Repeticiones para medir la CPU de las funciones puras
+CPU_ROUNDS = 50
+
+
+def _cpu_per_number(lite_html: bytes) -> float:
+    """Segundos de CPU por número: parseo del número, queries y HTML de cada query."""
+    queries = osint.build_osint_queries.__wrapped__("+34600111222", "+34 600 11 12 22")
+
+    start = time.process_time()
+    for _ in range(CPU_ROUNDS):
+        # Sin caché: se mide phonenumbers de verdad
+        cli._parse_cached.cache_clear()
+        cli.parse_phone_number("+34 600 111 222")
+        osint.build_osint_queries.__wrapped__("+34600111222", "+34 600 11 12 22")
+        for q in queries:
+            osint._parse_results(lite_html, 5, q)
+    return (time.process_time() - start) / CPU_ROUNDS
+
+
+def _scan_wall_time(mock_ddg, lite_html: bytes) -> float:
+    """Segundos de reloj de perform_osint con la red simulada."""
+    async def handler(request):
+        await asyncio.sleep(SIMULATED_LATENCY)
+        return httpx.Response(200, content=lite_html)
+
+    mock_ddg(handler)
+    start = time.perf_counter()
+    osint.perform_osint("+34600111222", "+34 600 11 12 22", max_results=5, delay=0, use_cache=False)
+    return time.perf_counter() - start
+
+
+@pytest.mark.perf
+def test_scan_is_io_bound(mock_ddg, lite_html):
+    cpu = _cpu_per_number(lite_html)
+    wall = _scan_wall_time(mock_ddg, lite_html)
+    ratio = cpu / wall
+
+    print(
+        f"\nCPU por número: {cpu * 1000:.2f} ms | "
+        f"reloj por número (latencia {SIMULATED_LATENCY * 1000:.0f} ms, sin delay): {wall * 1000:.0f} ms | "
+        f"CPU/total: {ratio:.1%}"
+    )
+
+    # Incluso sin la pausa de cortesía y con latencia baja, la CPU es minoritaria
+    assert ratio < 0.5
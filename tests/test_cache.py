@@ -0,0 +1,40 @@
+import sqlite3
+import time
+
+from nunmerdox.cache import OsintCache
+
+
+def test_set_then_get_roundtrip(tmp_path):
+    cache = OsintCache(tmp_path / "cache.sqlite3")
+    key = OsintCache.make_key("html:q", 5)
+
+    assert cache.get(key) is None
+    cache.set(key, [{"title": "á", "href": "https://x", "body": ""}])
+    assert cache.get(key) == [{"title": "á", "href": "https://x", "body": ""}]
+
+
+def test_key_depends_on_max_results():
+    assert OsintCache.make_key("q", 5) != OsintCache.make_key("q", 10)
+
+
+def test_expired_entries_are_missed_and_purged(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = OsintCache(path, ttl=0.05)
+
+    cache.set("old", [1])
+    time.sleep(0.1)
+    assert cache.get("old") is None
+
+    cache.set("new", [2])
+    rows = sqlite3.connect(str(path)).execute("SELECT key FROM osint").fetchall()
+    assert rows == [("new",)]
+
+
+def test_sqlite_errors_are_cache_misses(tmp_path):
+    # Un directorio en lugar del fichero: SQLite no puede abrirlo
+    path = tmp_path / "cache.sqlite3"
+    path.mkdir()
+    cache = OsintCache(path)
+
+    cache.set("k", [1])
+    assert cache.get("k") is None
@@ -0,0 +1,204 @@
+import csv
+import json
+import logging
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from nunmerdox import cli, osint
+from nunmerdox.cli import ResultSink, parse_phone_number, run_scan
+from nunmerdox.osint import OsintHit
+
+RECORDS = [
+    {
+        "e164": "+34600111222",
+        "intl": "+34 600 11 12 22",
+        "country": "ES",
+        "valid": True,
+        "inputs": ["+34600111222", "+34 600 111 222"],
+        "osint": [OsintHit('"+34600111222"', "Título", "https://a.es", "ñ")],
+    },
+    {
+        "e164": "+14155550100",
+        "intl": "+1 415-555-0100",
+        "country": "US",
+        "valid": True,
+        "inputs": ["+14155550100"],
+        "osint_error": "boom",
+    },
+]
+
+# RECORDS tal y como quedan en JSON: los OsintHit pasan a objetos
+RECORDS_JSON = [
+    {**RECORDS[0], "osint": [
+        {"query": '"+34600111222"', "title": "Título", "href": "https://a.es", "body": "ñ"}
+    ]},
+    RECORDS[1],
+]
+
+
+# --- parse_phone_number ---
+
+@pytest.mark.parametrize("number, e164", [
+    ("+34600111222", "+34600111222"),
+    ("(+34) 600-111-222", "+34600111222"),
+    ("0044 (0) 20 7946 0958", "+442079460958"),
+    ("0049 (0) 30 1234 5678", "+493012345678"),
+    ("+49 (0) 30 123 456 789", "+4930123456789"),
+])
+def test_parse_phone_number_accepts_formatted_input(number, e164):
+    assert parse_phone_number(number)["e164"] == e164
+
+
+@pytest.mark.parametrize("number", ["abc", "+1 2", "1" * 25, "+34 600 111 222 ext. 5"])
+def test_parse_phone_number_rejects_garbage(number):
+    assert parse_phone_number(number) is None
+
+
+@pytest.mark.parametrize("junk", [" " * 20000 + "x", "1 " * 20000 + "x", "(" * 20000 + "x"])
+def test_parse_phone_number_rejects_long_junk_quickly(junk):
+    start = time.perf_counter()
+    assert parse_phone_number(junk) is None
+    # Holgado a propósito: con backtracking cúbico esto tardaba minutos
+    assert time.perf_counter() - start < 1.0
+
+
+# --- ResultSink ---
+
+def test_json_sink_matches_json_dump(tmp_path):
+    path = tmp_path / "out.json"
+    cli.save_results(RECORDS, str(path))
+
+    assert path.read_text(encoding="utf-8") == json.dumps(RECORDS_JSON, indent=2, ensure_ascii=False)
+
+
+def test_json_sink_empty_is_valid_json(tmp_path):
+    path = tmp_path / "out.json"
+    cli.save_results([], str(path))
+
+    assert json.loads(path.read_text(encoding="utf-8")) == []
+
+
+def test_ndjson_sink_writes_one_record_per_line(tmp_path):
+    path = tmp_path / "out.ndjson"
+    cli.save_results(RECORDS, str(path))
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == RECORDS_JSON
+
+
+def test_csv_sink_writes_one_row_per_hit(tmp_path):
+    path = tmp_path / "out.csv"
+    cli.save_results(RECORDS, str(path))
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0][0] == "E164"
+    assert rows[1] == [
+        "+34600111222", "ES", "+34 600 11 12 22", '"+34600111222"', "Título", "https://a.es", "ñ",
+        "+34600111222; +34 600 111 222",
+    ]
+    # Sin OSINT: una fila con los campos OSINT vacíos
+    assert rows[2][:3] == ["+14155550100", "US", "+1 415-555-0100"]
+    assert rows[2][3:7] == ["", "", "", ""]
+
+
+def test_txt_sink_includes_hits_and_errors(tmp_path):
+    path = tmp_path / "out.txt"
+    cli.save_results(RECORDS, str(path))
+
+    text = path.read_text(encoding="utf-8")
+    assert "Número: +34600111222" in text
+    assert "Entradas: +34600111222, +34 600 111 222" in text
+    assert "URL: https://a.es" in text
+    assert "Error OSINT: boom" in text
+
+
+def test_console_sink_prints_after_close(capsys):
+    with ResultSink() as sink:
+        sink.write(RECORDS[0])
+        print("progreso")
+        assert "RESULTADOS" not in capsys.readouterr().out
+
+    out = capsys.readouterr().out
+    assert out.index("RESULTADOS") < out.index('"e164": "+34600111222"')
+    assert '"href": "https://a.es"' in out
+
+
+# --- run_scan ---
+
+def test_run_scan_dedupes_by_e164_keeping_first_order(tmp_path):
+    path = tmp_path / "out.ndjson"
+
+    run_scan(
+        ["+34600111222", "+14155550100", "+34 600 111 222", "no es un número"],
+        output=str(path)
+    )
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["e164"] for r in records] == ["+34600111222", "+14155550100"]
+    assert records[0]["inputs"] == ["+34600111222", "+34 600 111 222"]
+    assert records[1]["inputs"] == ["+14155550100"]
+
+
+
+def test_run_scan_osint_flushes_in_input_order(tmp_path, monkeypatch):
+    seen = []
+
+    def fake_batch(numbers, on_result=None, **options):
+        seen.extend(numbers)
+        # Terminan en orden inverso al de entrada
+        for index in reversed(range(len(numbers))):
+            e164 = numbers[index][0]
+            on_result(index, [OsintHit(f'"{e164}"', "t", "https://h", "b")], None)
+
+    monkeypatch.setattr(osint, "perform_osint_batch", fake_batch)
+    path = tmp_path / "out.ndjson"
+
+    run_scan(
+        ["+34600111222", "+14155550100", "+34 600 111 222", "no es un número"],
+        osint=True, osint_delay=0, output=str(path)
+    )
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["e164"] for r in records] == ["+34600111222", "+14155550100"]
+    assert records[0]["inputs"] == ["+34600111222", "+34 600 111 222"]
+    assert records[1]["osint"] == [
+        {"query": '"+14155550100"', "title": "t", "href": "https://h", "body": "b"}
+    ]
+    assert [e164 for e164, _ in seen] == ["+34600111222", "+14155550100"]
+
+
+def test_run_scan_records_osint_errors(tmp_path, monkeypatch):
+    def fake_batch(numbers, on_result=None, **options):
+        on_result(0, [], RuntimeError("DuckDuckGo limita"))
+
+    monkeypatch.setattr(osint, "perform_osint_batch", fake_batch)
+    path = tmp_path / "out.ndjson"
+
+    run_scan(["+34600111222"], osint=True, output=str(path))
+
+    record = json.loads(path.read_text(encoding="utf-8"))
+    assert record["osint_error"] == "DuckDuckGo limita"
+    assert "osint" not in record
+
+# --- --verbose ---
+
+def test_verbose_only_raises_package_loggers(monkeypatch):
+    monkeypatch.setattr(cli, "run_scan", lambda *args, **kwargs: None)
+    for name in ("nunmerdox", "httpx"):
+        monkeypatch.setattr(logging.getLogger(name), "level", logging.getLogger(name).level)
+
+    result = CliRunner().invoke(cli.app, ["+34600111222", "--agree-ethics", "--verbose"])
+
+    assert result.exit_code == 0, result.output
+    assert logging.getLogger("nunmerdox").getEffectiveLevel() == logging.DEBUG
+    assert logging.getLogger("httpx").getEffectiveLevel() == logging.INFO
+    for name in ("httpcore", "hpack", "h2", ""):
+        assert logging.getLogger(name).getEffectiveLevel() > logging.DEBUG
+
+
+def test_cli_registers_a_single_scan_command():
+    assert len(cli.app.registered_commands) == 1
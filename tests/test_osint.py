@@ -0,0 +1,349 @@
+import asyncio
+import copy
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+import pytest
+
+from nunmerdox import osint
+from nunmerdox.cache import OsintCache
+from nunmerdox.osint import OsintHit, TokenBucket, _LiteProgress, _parse_results
+
+_real_sleep = asyncio.sleep
+
+
+class _ThreadRecordingCache(OsintCache):
+    """OsintCache que anota en qué hilo se ejecuta cada operación."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value):
+        self.threads.append(threading.get_ident())
+        super().set(key, value)
+
+
+# --- _parse_results ---
+
+def test_parse_results_skips_ads_and_pairs_snippets(lite_html):
+    results = _parse_results(lite_html, 10, "q")
+
+    assert [r.href for r in results] == [
+        f"https://site{i}.example.org/contacto/{i}" for i in range(1, 11)
+    ]
+    assert all(r.query == "q" for r in results)
+    assert results[0].title == "Resultado 1 - Directorio de empresas"
+    # Los <b> del snippet no pegan palabras
+    assert "contacto +34 600 11 12 22 publicado" in results[0].body
+    # El resultado 4 no tiene snippet: no hereda el del 5
+    assert results[3].body == ""
+    assert "ficha 5" in results[4].body
+
+
+def test_parse_results_respects_max_results(lite_html):
+    results = _parse_results(lite_html, 3)
+
+    assert len(results) == 3
+    assert "ficha 3" in results[2].body
+
+
+def test_parse_results_empty_page():
+    assert _parse_results(b"<html><body>No results.</body></html>", 5) == []
+
+
+def test_parse_results_keeps_last_result_without_snippet():
+    html = b'<a class="result-link" href="https://a.es">A</a>'
+
+    assert _parse_results(html, 5, "q") == [OsintHit("q", "A", "https://a.es", "")]
+
+
+def test_osint_hit_copies_and_pickles():
+    hit = OsintHit("q", "t", "https://h", "b")
+
+    assert copy.copy(hit) == hit
+    assert copy.deepcopy(hit) == hit
+    assert pickle.loads(pickle.dumps(hit)) == hit
+    assert hit.to_dict() == {"query": "q", "title": "t", "href": "https://h", "body": "b"}
+    assert not hasattr(hit, "__dict__")
+
+
+# --- corte anticipado (_LiteProgress) ---
+
+def _has_enough(content, max_results):
+    return _LiteProgress(max_results)(content)
+
+
+def test_lite_progress_waits_for_next_result(lite_html):
+    # Cortar justo antes del enlace del resultado 4: hay 3 completos
+    cut = lite_html[:lite_html.index(b"https://site4.")]
+
+    assert _has_enough(cut, 2)
+    assert not _has_enough(cut, 3)
+    # Los anuncios no cuentan como resultados
+    assert not _has_enough(lite_html[:lite_html.index(b"https://site1.")], 1)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096])
+def test_lite_progress_counts_markers_split_across_chunks(lite_html, chunk_size):
+    buffer = bytearray()
+    progress = _LiteProgress(9)
+    previous = stopped = None
+
+    for i in range(0, len(lite_html), chunk_size):
+        previous = len(buffer)
+        buffer += lite_html[i:i + chunk_size]
+        if progress(buffer):
+            stopped = len(buffer)
+            break
+
+    # Mismo resultado que contar el buffer entero: corta en el primer chunk
+    # que completa el enlace del décimo resultado, ni antes ni después
+    assert stopped is not None
+    assert not _has_enough(lite_html[:previous], 9)
+    assert _has_enough(lite_html[:stopped], 9)
+
+
+def test_client_rejects_negative_max_retries():
+    with pytest.raises(ValueError):
+        osint.OsintClient(max_retries=-1)
+
+
+# --- caché ---
+
+def test_cache_runs_off_the_event_loop_thread(mock_ddg, lite_html, tmp_path):
+    cache = _ThreadRecordingCache(tmp_path / "cache.sqlite3")
+
+    async def lookup():
+        async with osint.OsintClient(max_results=1, delay=0) as client:
+            client.cache = cache
+            return await client.lookup("+34600111222")
+
+    mock_ddg(lambda request: httpx.Response(200, content=lite_html))
+    first = asyncio.run(lookup())
+    requests = mock_ddg(lambda request: httpx.Response(500))
+    second = asyncio.run(lookup())
+
+    assert first == second
+    assert requests == []
+    assert cache.threads and threading.get_ident() not in cache.threads
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+def test_sync_search_uses_one_shared_cache(lite_html, tmp_path, monkeypatch):
+    calls = []
+
+    class FakeSession:
+        def get(self, url, params=None, timeout=None):
+            calls.append(params["q"])
+            return _FakeResponse(lite_html)
+
+    cache = OsintCache(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(osint, "_get_session", FakeSession)
+    monkeypatch.setattr(osint, "_default_cache", lambda: cache)
+
+    first = osint.search_duckduckgo("q", max_results=2)
+    second = osint.search_duckduckgo("q", max_results=2)
+
+    assert first == second and len(first) == 2
+    assert calls == ["q"]
+
+
+def test_default_cache_is_a_single_instance():
+    assert osint._default_cache() is osint._default_cache()
+
+
+# --- parse_executor ---
+
+def test_parses_inline_without_executor(mock_ddg, lite_html, monkeypatch):
+    parse_threads = []
+    url, params, parse, enough = osint.BACKENDS["html"]
+
+    def recording_parse(*args):
+        parse_threads.append(threading.get_ident())
+        return parse(*args)
+
+    monkeypatch.setitem(osint.BACKENDS, "html", (url, params, recording_parse, enough))
+    mock_ddg(lambda request: httpx.Response(200, content=lite_html))
+
+    hits = osint.perform_osint("+34600111222", max_results=1, delay=0, use_cache=False)
+
+    assert len(hits) == len(osint.build_osint_queries("+34600111222"))
+    assert set(parse_threads) == {threading.get_ident()}
+
+
+def test_parses_in_process_pool_when_given(mock_ddg, lite_html):
+    mock_ddg(lambda request: httpx.Response(200, content=lite_html))
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        hits = osint.perform_osint(
+            "+34600111222", max_results=2, delay=0, use_cache=False, parse_executor=pool
+        )
+
+    assert len(hits) == 2 * len(osint.build_osint_queries("+34600111222"))
+
+
+# --- TokenBucket ---
+
+class _FakeClock:
+    """Reloj simulado: asyncio.sleep avanza el tiempo sin esperar de verdad."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await _real_sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(osint, "time", fake)
+    monkeypatch.setattr(osint.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def test_token_bucket_without_rate_never_waits(clock):
+    bucket = TokenBucket.from_delay(0)
+
+    async def run():
+        for _ in range(100):
+            await bucket.acquire()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == []
+    bucket.on_throttle()
+    bucket.on_success()
+    assert bucket.rate is None
+
+
+def test_token_bucket_paces_after_burst(clock):
+    bucket = TokenBucket.from_delay(0.5, capacity=2)
+    stamps = []
+
+    async def run():
+        for _ in range(5):
+            await bucket.acquire()
+            stamps.append(clock.now)
+
+    asyncio.run(run())
+
+    # Ráfaga de 2 sin espera, luego una cada 0.5s
+    assert stamps == pytest.approx([0.0, 0.0, 0.5, 1.0, 1.5])
+
+
+def test_token_bucket_slows_down_after_throttle(clock):
+    bucket = TokenBucket.from_delay(0.5)
+
+    async def run():
+        await bucket.acquire()
+        bucket.on_throttle()
+        await bucket.acquire()
+
+    asyncio.run(run())
+
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_token_bucket_halves_on_throttle_and_recovers():
+    bucket = TokenBucket(8.0)
+
+    bucket.on_throttle()
+    assert bucket.rate == 4.0
+    for _ in range(10):
+        bucket.on_throttle()
+    assert bucket.rate == 8.0 * TokenBucket.MIN_RATE_FACTOR
+
+    for _ in range(100):
+        bucket.on_success()
+    assert bucket.rate == 8.0
+
+
+def test_perform_osint_retries_rate_limit(mock_ddg, lite_html, clock):
+    statuses = iter([202, 429])
+
+    def handler(request):
+        return httpx.Response(next(statuses, 200), content=lite_html)
+
+    requests = mock_ddg(handler)
+    hits = osint.perform_osint("+34600111222", max_results=1, delay=0, concurrency=1, use_cache=False)
+
+    assert len(hits) == len(osint.build_osint_queries("+34600111222"))
+    assert len(requests) == len(hits) + 2
+    # Backoff exponencial entre reintentos
+    assert clock.sleeps == [1, 2]
+
+
+def test_perform_osint_tags_hits_with_query(mock_ddg, lite_html):
+    requests = mock_ddg(lambda request: httpx.Response(200, content=lite_html))
+
+    hits = osint.perform_osint("+34600111222", "+34 600 11 12 22", max_results=2, delay=0, use_cache=False)
+
+    queries = osint.build_osint_queries("+34600111222", "+34 600 11 12 22")
+    assert len(requests) == len(queries)
+    assert [h.query for h in hits] == [q for q in queries for _ in range(2)]
+    assert all(isinstance(h, OsintHit) for h in hits)
+
+
+# --- E.164 no buscable ---
+
+@pytest.mark.parametrize("e164", ["", "+123", "34600111222", "+34 600 11 12 22", "+1234567890123456"])
+def test_perform_osint_skips_invalid_e164(mock_ddg, e164):
+    requests = mock_ddg(lambda request: httpx.Response(500))
+
+    assert osint.perform_osint(e164, use_cache=False) == []
+    assert requests == []
+
+
+# --- OsintClient / lote ---
+
+def test_perform_osint_batch_reports_in_input_order(mock_ddg, lite_html):
+    async def handler(request):
+        # El primer número tarda más: termina el último
+        if "600111222" in str(request.url):
+            await _real_sleep(0.05)
+        return httpx.Response(200, content=lite_html)
+
+    mock_ddg(handler)
+    finished = []
+
+    results = osint.perform_osint_batch(
+        ["+34600111222", ("+34600111333", None)],
+        on_result=lambda i, hits, error: finished.append(i),
+        max_results=1, delay=0, concurrency=8, use_cache=False
+    )
+
+    assert finished == [1, 0]
+    assert [hits[0].query for hits in results] == ['"+34600111222"', '"+34600111333"']
+
+
+def test_client_refuses_to_switch_loop_while_open(mock_ddg, lite_html):
+    mock_ddg(lambda request: httpx.Response(200, content=lite_html))
+    client = osint.OsintClient(max_results=1, delay=0, use_cache=False)
+
+    asyncio.run(client.lookup("+34600111222"))
+    with pytest.raises(RuntimeError):
+        asyncio.run(client.lookup("+34600111222"))
+